@@ -31,6 +31,8 @@ class PaymentOrchestrationSDK:
         self.is_test: bool = False
         self.bt_api_key: str = ""
         self.provider_config: Optional[ProviderConfig] = None
+        self._adyen_client: Optional[AdyenClient] = None
+        self._checkout_client: Optional[CheckoutClient] = None
 
     @classmethod
     def init(cls, config: Dict[str, Any]) -> 'PaymentOrchestrationSDK':
@@ -46,6 +48,8 @@ class PaymentOrchestrationSDK:
             raise ConfigurationError("'provider_config' parameter is required")
 
         instance = cast(PaymentOrchestrationSDK, cls._instance)
+        # Drop clients built for a previous configuration
+        instance.close()
         instance.is_test = config['is_test']
         instance.bt_api_key = config['bt_api_key']
 
@@ -78,19 +82,33 @@ class PaymentOrchestrationSDK:
             raise ConfigurationError("PaymentOrchestrationSDK must be initialized with init() before use")
         return cls._instance
 
+    def close(self) -> None:
+        """Close the provider clients and their pooled HTTP connections.
+
+        Clients are rebuilt on next access, so the SDK remains usable after closing.
+        """
+        if self._adyen_client is not None:
+            self._adyen_client.close()
+            self._adyen_client = None
+        if self._checkout_client is not None:
+            self._checkout_client.close()
+            self._checkout_client = None
+
     @property
     def adyen(self) -> AdyenClient:
         """Get the Adyen client instance."""
         if not self.provider_config or not self.provider_config.adyen:
             raise ConfigurationError("Adyen is not configured")
 
-        return AdyenClient(
-            api_key=self.provider_config.adyen.api_key,
-            merchant_account=self.provider_config.adyen.merchant_account,
-            is_test=self.is_test,
-            bt_api_key=self.bt_api_key,
-            production_prefix=self.provider_config.adyen.production_prefix
-        )
+        if self._adyen_client is None:
+            self._adyen_client = AdyenClient(
+                api_key=self.provider_config.adyen.api_key,
+                merchant_account=self.provider_config.adyen.merchant_account,
+                is_test=self.is_test,
+                bt_api_key=self.bt_api_key,
+                production_prefix=self.provider_config.adyen.production_prefix
+            )
+        return self._adyen_client
 
     @property
     def checkout(self) -> CheckoutClient:
@@ -98,9 +116,11 @@ class PaymentOrchestrationSDK:
         if not self.provider_config or not self.provider_config.checkout:
             raise ConfigurationError("Checkout is not configured")
 
-        return CheckoutClient(
-            private_key=self.provider_config.checkout.private_key,
-            processing_channel=self.provider_config.checkout.processing_channel,
-            is_test=self.is_test,
-            bt_api_key=self.bt_api_key
-        )
\ No newline at end of file
+        if self._checkout_client is None:
+            self._checkout_client = CheckoutClient(
+                private_key=self.provider_config.checkout.private_key,
+                processing_channel=self.provider_config.checkout.processing_channel,
+                is_test=self.is_test,
+                bt_api_key=self.bt_api_key
+            )
+        return self._checkout_client
\ No newline at end of file
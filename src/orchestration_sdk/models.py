@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Type, TypeVar, cast
 from datetime import datetime
 
 
@@ -90,12 +90,27 @@ class ErrorType(Enum):
         self.category = category
 
 
+_T = TypeVar("_T")
+
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with __slots__ for its fields, like dataclass(slots=True) on Python 3.10+."""
+    field_names = tuple(field.name for field in fields(cast(Any, cls)))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = field_names
+    return cast(Type[_T], type(cls.__name__, cls.__bases__, namespace))
+
+
+@_slotted
 @dataclass
 class Amount:
     value: int
     currency: str = "USD"
 
 
+@_slotted
 @dataclass
 class Source:
     type: SourceType
@@ -104,6 +119,7 @@ class Source:
     holder_name: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class Address:
     address_line1: Optional[str] = None
@@ -114,6 +130,7 @@ class Address:
     country: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class Customer:
     reference: Optional[str] = None
@@ -123,12 +140,14 @@ class Customer:
     address: Optional[Address] = None
 
 
+@_slotted
 @dataclass
 class StatementDescription:
     name: Optional[str] = None
     city: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class ThreeDS:
     eci: Optional[str] = None
@@ -137,6 +156,7 @@ class ThreeDS:
     version: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class TransactionRequest:
     amount: Amount
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Tuple, Optional, Union, cast
+from typing import Dict, Any, Tuple, Optional, Union, Callable, cast
 from datetime import datetime, timezone
 import requests
 from deepmerge import always_merger
@@ -24,11 +24,17 @@ from ..models import (
     TransactionSource,
     ProvisionedSource
 )
-from ..utils.model_utils import create_transaction_request, validate_required_fields
+from ..utils.model_utils import validate_required_fields
 from ..utils.request_client import RequestClient
+from ..utils.batch_utils import BatchTransactionsMixin
+from ..utils.json_utils import loads
 from ..exceptions import TransactionError
 
 
+# Bound once so per-request source type checks avoid the enum attribute lookup
+PROCESSOR_TOKEN = SourceType.PROCESSOR_TOKEN
+
+
 RECURRING_TYPE_MAPPING = {
     RecurringType.ONE_TIME: None,
     RecurringType.CARD_ON_FILE: "CardOnFile",
@@ -50,6 +56,10 @@ STATUS_CODE_MAPPING = {
 }
 
 
+# Adyen resultCodes that are returned with HTTP 200 but represent a failed payment
+DECLINED_RESULT_CODES = frozenset({"Refused", "Error", "Cancelled"})
+
+
 # Mapping of Adyen refusal reason codes to our error types
 ERROR_CODE_MAPPING = {
     "2": ErrorType.REFUSED,  # Refused
@@ -98,12 +108,55 @@ ERROR_CODE_MAPPING = {
 }
 
 
-class AdyenClient:
+def _processor_token_payment_method(source: Source) -> Dict[str, Any]:
+    """Build the Adyen paymentMethod for a stored processor token."""
+    return {
+        "type": "scheme",
+        "storedPaymentMethodId": source.id
+    }
+
+
+def _basis_theory_payment_method(token_prefix: str) -> Callable[[Source], Dict[str, Any]]:
+    """Build a paymentMethod factory with the Basis Theory expressions for token_prefix pre-rendered."""
+    number = f"{{{{ {token_prefix}: %s | json: '$.data.number'}}}}"
+    expiry_month = f"{{{{ {token_prefix}: %s | json: '$.data.expiration_month'}}}}"
+    expiry_year = f"{{{{ {token_prefix}: %s | json: '$.data.expiration_year'}}}}"
+    cvc = f"{{{{ {token_prefix}: %s | json: '$.data.cvc'}}}}"
+
+    def build(source: Source) -> Dict[str, Any]:
+        return {
+            "type": "scheme",
+            "number": number % source.id,
+            "expiryMonth": expiry_month % source.id,
+            "expiryYear": expiry_year % source.id,
+            "cvc": cvc % source.id
+        }
+
+    return build
+
+
+# Payment method builders specialized per source type
+PAYMENT_METHOD_BUILDERS: Dict[SourceType, Callable[[Source], Dict[str, Any]]] = {
+    SourceType.PROCESSOR_TOKEN: _processor_token_payment_method,
+    SourceType.BASIS_THEORY_TOKEN: _basis_theory_payment_method("token"),
+    SourceType.BASIS_THEORY_TOKEN_INTENT: _basis_theory_payment_method("token_intent")
+}
+
+
+class AdyenClient(BatchTransactionsMixin):
     def __init__(self, api_key: str, merchant_account: str, is_test: bool, bt_api_key: str, production_prefix: str):
         self.api_key = api_key
         self.merchant_account = merchant_account
         self.base_url = "https://checkout-test.adyen.com/v71" if is_test else f"https://{production_prefix}-checkout-live.adyenpayments.com/checkout/v71"
         self.request_client = RequestClient(bt_api_key)
+        # Headers are constant per client; RequestClient merges them over its JSON defaults
+        self._headers = {
+            "X-API-Key": api_key
+        }
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this client."""
+        self.request_client.close()
 
     def _get_status_code(self, adyen_result_code: Optional[str]) -> TransactionStatusCode:
         """Map Adyen result code to our status code."""
@@ -137,19 +190,9 @@ class AdyenClient:
                 payload["recurringProcessingModel"] = recurring_type
 
         # Process source based on type
-        payment_method: Dict[str, Any] = {"type": "scheme"}
-        
-        if request.source.type == SourceType.PROCESSOR_TOKEN:
-            payment_method["storedPaymentMethodId"] = request.source.id
-        elif request.source.type in [SourceType.BASIS_THEORY_TOKEN, SourceType.BASIS_THEORY_TOKEN_INTENT]:
-            # Add card data with Basis Theory expressions
-            token_prefix = "token_intent" if request.source.type == SourceType.BASIS_THEORY_TOKEN_INTENT else "token"
-            payment_method.update({
-                "number": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.number'}}}}",
-                "expiryMonth": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.expiration_month'}}}}",
-                "expiryYear": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.expiration_year'}}}}",
-                "cvc": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.cvc'}}}}"
-            })      
+        build_payment_method = PAYMENT_METHOD_BUILDERS.get(request.source.type)
+        payment_method: Dict[str, Any] = build_payment_method(request.source) if build_payment_method else {"type": "scheme"}
+
         if request.source.holder_name:
                 payment_method["holderName"] = request.source.holder_name
 
@@ -179,7 +222,7 @@ class AdyenClient:
             # Map address fields
             if request.customer.address:
                 address = request.customer.address
-                if any([address.address_line1, address.city, address.state, address.zip, address.country]):
+                if address.address_line1 or address.city or address.state or address.zip or address.country:
                     billing_address: Dict[str, str] = {}
 
                     # Map address_line1 to street
@@ -231,42 +274,49 @@ class AdyenClient:
 
     def _transform_adyen_response(self, response_data: Dict[str, Any], request: TransactionRequest) -> TransactionResponse:
         """Transform Adyen response to our standardized format."""
-        transaction_response = TransactionResponse(
+        amount = response_data.get("amount") or {}
+        additional_data = response_data.get("additionalData") or {}
+        result_code = response_data.get("resultCode")
+
+        # checking both as recurringDetailReference is deprecated, although it still appears without storedPaymentMethodId
+        provisioned_id = (
+            (response_data.get("paymentMethod") or {}).get("storedPaymentMethodId")
+            or additional_data.get("recurring.recurringDetailReference")
+        )
+
+        return TransactionResponse(
             id=str(response_data.get("pspReference")),
             reference=str(response_data.get("merchantReference")),
             amount=Amount(
-                value=int(response_data.get("amount", {}).get("value")),
-                currency=str(response_data.get("amount", {}).get("currency"))
+                value=int(amount["value"]),
+                currency=str(amount.get("currency"))
             ),
             status=TransactionStatus(
-                code=self._get_status_code(response_data.get("resultCode")),
-                provider_code=str(response_data.get("resultCode"))
+                code=self._get_status_code(result_code),
+                provider_code=str(result_code)
             ),
             source=TransactionSource(
                 type=request.source.type,
                 id=request.source.id,
+                provisioned=ProvisionedSource(id=provisioned_id) if provisioned_id else None
             ),
-            network_transaction_id=str(response_data.get("additionalData", {}).get("networkTxReference")),
+            network_transaction_id=str(additional_data.get("networkTxReference")),
             full_provider_response=response_data,
             created_at=datetime.now(timezone.utc)
         )
 
-        # checking both as recurringDetailReference is deprecated, although it still appears without storedPaymentMethodId
-        stored_payment_id = response_data.get("paymentMethod", {}).get("storedPaymentMethodId")
-        recurring_ref = response_data.get("additionalData", {}).get("recurring.recurringDetailReference")
-        
-        if stored_payment_id or recurring_ref:
-            transaction_response.source.provisioned = ProvisionedSource(id=stored_payment_id or recurring_ref)
-
-
-        return transaction_response
-
-    def _transform_error_response(self, response: requests.Response, response_data: Dict[str, Any]) -> ErrorResponse:
+    def _transform_error_response(
+        self,
+        response: requests.Response,
+        response_data: Dict[str, Any],
+        result_code: Optional[str] = None
+    ) -> ErrorResponse:
         """Transform error responses to our standardized format.
         
         Args:
             response: The HTTP response object
             response_data: The parsed JSON response data
+            result_code: Adyen's resultCode, when the caller already read it from a payment response
             
         Returns:
             Dict[str, Any]: Standardized error response
@@ -277,7 +327,7 @@ class AdyenClient:
         elif response.status_code == 403:
             error_type = ErrorType.UNAUTHORIZED
         # Handle Adyen-specific error codes for declined transactions
-        elif response_data.get("resultCode") in ["Refused", "Error", "Cancelled"]:
+        elif result_code in DECLINED_RESULT_CODES:
             refusal_code = response_data.get("refusalReasonCode", "")
             error_type = ERROR_CODE_MAPPING.get(refusal_code, ErrorType.OTHER)
         else:
@@ -302,38 +352,33 @@ class AdyenClient:
         # Transform to Adyen's format
         payload = self._transform_to_adyen_payload(request_data)
 
-        # Set up common headers
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
         # Make the request (using proxy for BT tokens, direct for processor tokens)
         try:
-            response = self.request_client.request(
+            response = await self.request_client.request_async(
                 url=f"{self.base_url}/payments",
                 method="POST",
-                headers=headers,
+                headers=self._headers,
                 data=payload,
-                use_bt_proxy=request_data.source.type != SourceType.PROCESSOR_TOKEN
+                use_bt_proxy=request_data.source.type != PROCESSOR_TOKEN
             )
 
-            response_data = response.json()
+            response_data = loads(response.content)
+            result_code = response_data.get("resultCode")
 
             # Check if it's an error response (non-200 status code or Adyen error)
-            if not response.ok or response_data.get("resultCode") in ["Refused", "Error", "Cancelled"]:
-                raise TransactionError(self._transform_error_response(response, response_data))
+            if not response.ok or result_code in DECLINED_RESULT_CODES:
+                raise TransactionError(self._transform_error_response(response, response_data, result_code))
 
             # Transform the successful response to our format
             return self._transform_adyen_response(response_data, request_data)
 
         except requests.exceptions.HTTPError as e:
             try:
-                error_data = e.response.json()
+                error_data = loads(e.response.content)
             except:
                 error_data = None
 
-            raise TransactionError(self._transform_error_response(e.response, error_data))
+            raise TransactionError(self._transform_error_response(e.response, error_data)) from e
 
 
     async def refund_transaction(self, refund_request: RefundRequest) -> RefundResponse:
@@ -346,12 +391,6 @@ class AdyenClient:
         Returns:
             RefundResponse: The refund response
         """
-        # Set up headers
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
         # Prepare the refund payload
         payload = {
             "merchantAccount": self.merchant_account,
@@ -368,15 +407,15 @@ class AdyenClient:
 
         try:
             # Make request to Adyen
-            response = self.request_client.request(
+            response = await self.request_client.request_async(
                 url=f"{self.base_url}/payments/{refund_request.original_transaction_id}/refunds",
                 method="POST",
-                headers=headers,
+                headers=self._headers,
                 data=payload,
                 use_bt_proxy=False  # Refunds don't need BT proxy
             )
 
-            response_data = response.json()
+            response_data = loads(response.content)
             
             # Transform the response to a standardized format
             return RefundResponse(
@@ -397,9 +436,9 @@ class AdyenClient:
 
         except requests.exceptions.HTTPError as e:
             try:
-                error_data = e.response.json()
+                error_data = loads(e.response.content)
             except:
                 error_data = None
 
-            raise TransactionError(self._transform_error_response(e.response, error_data))
+            raise TransactionError(self._transform_error_response(e.response, error_data)) from e
 
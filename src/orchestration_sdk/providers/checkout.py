@@ -1,9 +1,8 @@
-from typing import Dict, Any, Tuple, Optional, Union, cast
+from typing import Dict, Any, Tuple, Optional, Union, Callable, cast
 from datetime import datetime, timezone
 from deepmerge import always_merger
 import requests
 import os
-import json
 from json.decoder import JSONDecodeError
 
 from ..models import (
@@ -29,8 +28,14 @@ from ..models import (
     ProvisionedSource
 )
 from orchestration_sdk.exceptions import TransactionError
-from ..utils.model_utils import create_transaction_request, validate_required_fields
+from ..utils.model_utils import validate_required_fields
 from ..utils.request_client import RequestClient
+from ..utils.batch_utils import BatchTransactionsMixin
+from ..utils.json_utils import loads
+
+
+# Bound once so per-request source type checks avoid the enum attribute lookup
+PROCESSOR_TOKEN = SourceType.PROCESSOR_TOKEN
 
 
 RECURRING_TYPE_MAPPING = {
@@ -170,12 +175,65 @@ ERROR_CODE_MAPPING = {
 }
 
 
-class CheckoutClient:
+def _processor_token_source(source: Source) -> Dict[str, Any]:
+    """Build the Checkout.com source for a stored processor token."""
+    return {
+        "type": "id",
+        "id": source.id
+    }
+
+
+def _basis_theory_source(token_prefix: str) -> Callable[[Source], Dict[str, Any]]:
+    """Build a source factory with the Basis Theory expressions for token_prefix pre-rendered."""
+    number = f"{{{{ {token_prefix}: %s | json: '$.data.number'}}}}"
+    expiry_month = f"{{{{ {token_prefix}: %s | json: '$.data.expiration_month'}}}}"
+    expiry_year = f"{{{{ {token_prefix}: %s | json: '$.data.expiration_year'}}}}"
+    cvv = f"{{{{ {token_prefix}: %s | json: '$.data.cvc'}}}}"
+
+    def build(source: Source) -> Dict[str, Any]:
+        return {
+            "type": "card",
+            "number": number % source.id,
+            "expiry_month": expiry_month % source.id,
+            "expiry_year": expiry_year % source.id,
+            "cvv": cvv % source.id,
+            "store_for_future_use": source.store_with_provider
+        }
+
+    return build
+
+
+def _parse_processed_on(value: str) -> datetime:
+    """Parse Checkout.com's UTC timestamps, e.g. 2024-01-01T12:00:00.1234567Z, to whole seconds.
+
+    The fraction isn't always present, and before Python 3.11 fromisoformat can't
+    read the Z suffix or 7-digit fractions.
+    """
+    return datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+
+
+# Source builders specialized per source type
+SOURCE_BUILDERS: Dict[SourceType, Callable[[Source], Dict[str, Any]]] = {
+    SourceType.PROCESSOR_TOKEN: _processor_token_source,
+    SourceType.BASIS_THEORY_TOKEN: _basis_theory_source("token"),
+    SourceType.BASIS_THEORY_TOKEN_INTENT: _basis_theory_source("token_intent")
+}
+
+
+class CheckoutClient(BatchTransactionsMixin):
     def __init__(self, private_key: str, processing_channel: str, is_test: bool, bt_api_key: str):
         self.api_key = private_key
         self.processing_channel = processing_channel
         self.base_url = "https://api.sandbox.checkout.com" if is_test else "https://api.checkout.com"
         self.request_client = RequestClient(bt_api_key)
+        # Headers are constant per client; RequestClient merges them over its JSON defaults
+        self._headers = {
+            "Authorization": f"Bearer {private_key}"
+        }
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this client."""
+        self.request_client.close()
 
     def _get_status_code(self, checkout_status: Optional[str]) -> TransactionStatusCode:
         """Map Checkout.com status to our status code."""
@@ -203,23 +261,9 @@ class CheckoutClient:
         if request. previous_network_transaction_id:
             payload["previous_payment_id"] = request. previous_network_transaction_id
         # Process source based on type
-        if request.source.type == SourceType.PROCESSOR_TOKEN:
-            payload["source"] = {
-                "type": "id",
-                "id": request.source.id
-            }
-        elif request.source.type in [SourceType.BASIS_THEORY_TOKEN, SourceType.BASIS_THEORY_TOKEN_INTENT]:
-            # Add card data with Basis Theory expressions
-            token_prefix = "token_intent" if request.source.type == SourceType.BASIS_THEORY_TOKEN_INTENT else "token"
-            source_data: Dict[str, Any] = {
-                "type": "card",
-                "number": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.number'}}}}",
-                "expiry_month": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.expiration_month'}}}}",
-                "expiry_year": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.expiration_year'}}}}",
-                "cvv": f"{{{{ {token_prefix}: {request.source.id} | json: '$.data.cvc'}}}}",
-                "store_for_future_use": request.source.store_with_provider
-            }
-            payload["source"] = source_data
+        build_source = SOURCE_BUILDERS.get(request.source.type)
+        if build_source:
+            payload["source"] = build_source(request.source)
 
         # Add customer information if provided
         if request.customer:
@@ -283,8 +327,6 @@ class CheckoutClient:
         if request.override_provider_properties:
             payload = always_merger.merge(payload, request.override_provider_properties)
 
-        print(f"Payload: {json.dumps(payload, indent=2)}")
-
         return payload
 
     def _transform_checkout_response(self, response_data: Dict[str, Any], request: TransactionRequest) -> TransactionResponse:
@@ -308,7 +350,7 @@ class CheckoutClient:
                 ) if response_data.get("source", {}).get("id") else None
             ),
             full_provider_response=response_data,
-            created_at=datetime.fromisoformat(response_data["processed_on"].split(".")[0] + "+00:00") if response_data.get("processed_on") else datetime.now(timezone.utc),
+            created_at=_parse_processed_on(response_data["processed_on"]) if response_data.get("processed_on") else datetime.now(timezone.utc),
             network_transaction_id=str(response_data.get("processing", {}).get("acquirer_transaction_id"))
         )
 
@@ -354,36 +396,26 @@ class CheckoutClient:
         validate_required_fields(request_data)
         # Transform request to Checkout.com format
         payload = self._transform_to_checkout_payload(request_data)
-        
-        # Set up common headers
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
 
         try:
             # Make request to Checkout.com
-            response = self.request_client.request(
+            response = await self.request_client.request_async(
                 url=f"{self.base_url}/payments",
                 method="POST",
-                headers=headers,
+                headers=self._headers,
                 data=payload,
-                use_bt_proxy=request_data.source.type != SourceType.PROCESSOR_TOKEN
+                use_bt_proxy=request_data.source.type != PROCESSOR_TOKEN
             )
         except requests.exceptions.HTTPError as e:
-            # Check if this is a BT error
-            if hasattr(e, 'bt_error_response'):
-                return e.bt_error_response
-            
             try:
-                error_data = e.response.json()
+                error_data = loads(e.response.content)
             except:
                 error_data = None
 
-            raise TransactionError(self._transform_error_response_object(e.response, error_data))
+            raise TransactionError(self._transform_error_response_object(e.response, error_data)) from e
 
         # Transform response to SDK format
-        return self._transform_checkout_response(response.json(), request_data)
+        return self._transform_checkout_response(loads(response.content), request_data)
 
     async def refund_transaction(self, refund_request: RefundRequest) -> RefundResponse:
         """
@@ -394,12 +426,6 @@ class CheckoutClient:
         Returns:
             Union[RefundResponse, ErrorResponse]: The refund response or error response
         """
-        # Set up headers
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
         # Prepare the refund payload
         payload = {
             "reference": refund_request.reference,
@@ -409,15 +435,15 @@ class CheckoutClient:
 
         try:
             # Make request to Checkout.com
-            response = self.request_client.request(
+            response = await self.request_client.request_async(
                 url=f"{self.base_url}/payments/{refund_request.original_transaction_id}/refunds",
                 method="POST",
-                headers=headers,
+                headers=self._headers,
                 data=payload,
                 use_bt_proxy=False  # Refunds don't need BT proxy
             )
 
-            response_data = response.json()
+            response_data = loads(response.content)
             
             # Transform the response to a standardized format
             return RefundResponse(
@@ -432,9 +458,9 @@ class CheckoutClient:
 
         except requests.exceptions.HTTPError as e:
             try:
-                error_data = e.response.json()
+                error_data = loads(e.response.content)
             except:
                 error_data = None
 
-            raise TransactionError(self._transform_error_response_object(e.response, error_data))
+            raise TransactionError(self._transform_error_response_object(e.response, error_data)) from e
             
@@ -0,0 +1,30 @@
+from typing import List, Protocol, Union
+import asyncio
+from ..models import TransactionRequest, TransactionResponse
+
+
+class _TransactionClient(Protocol):
+    async def transaction(self, request_data: TransactionRequest) -> TransactionResponse: ...
+
+
+class BatchTransactionsMixin:
+    """Adds transaction_many() to a provider client that implements transaction()."""
+
+    async def transaction_many(
+        self: _TransactionClient,
+        requests_data: List[TransactionRequest],
+        concurrency: int = 10
+    ) -> List[Union[TransactionResponse, BaseException]]:
+        """
+        Process several transactions concurrently, with at most `concurrency` in flight at once.
+
+        Results are returned in the same order as `requests_data`. A transaction that fails
+        does not cancel the others; its exception is returned in its position instead.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(request_data: TransactionRequest) -> TransactionResponse:
+            async with semaphore:
+                return await self.transaction(request_data)
+
+        return await asyncio.gather(*(run(r) for r in requests_data), return_exceptions=True)
@@ -0,0 +1,27 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore  # optional, installed with the `orjson` extra
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to a UTF-8 encoded JSON body, rejecting NaN and Infinity like requests' json= does."""
+    return json.dumps(data, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def loads(body: Union[bytes, str]) -> Any:
+    """Parse a JSON response body, using orjson when the `orjson` extra is installed.
+
+    orjson rejects the NaN and Infinity literals the stdlib accepts, so those bodies are
+    parsed by the stdlib instead. Integers wider than 64 bits come back as floats from orjson.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
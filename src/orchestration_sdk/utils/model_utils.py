@@ -1,3 +1,4 @@
+from dataclasses import fields
 from typing import Dict, Any, Optional
 from ..models import (
     TransactionRequest,
@@ -13,6 +14,14 @@ from ..models import (
 from ..exceptions import ValidationError
 
 
+# ThreeDS field names; 3DS data already keyed by them skips the lowercasing pass
+_THREE_DS_FIELDS = frozenset(field.name for field in fields(ThreeDS))
+
+# Value-to-member tables; the Enum call is only reached for unknown values, to raise ValueError
+_SOURCE_TYPES = {member.value: member for member in SourceType}
+_RECURRING_TYPES = {member.value: member for member in RecurringType}
+
+
 def validate_required_fields(data: TransactionRequest) -> None:
     """
     Validate required fields in a transaction request.
@@ -42,28 +51,41 @@ def create_transaction_request(data: Dict[str, Any]) -> TransactionRequest:
     Raises:
         ValidationError: If required fields are missing
     """
+    amount = data.get('amount') or {}
+    source = data.get('source') or {}
+
     return TransactionRequest(
         amount=Amount(
-            value=data.get('amount', {}).get('value', 0),
-            currency=data.get('amount', {}).get('currency', 'USD')
+            value=amount.get('value', 0),
+            currency=amount.get('currency', 'USD')
         ),
         source=Source(
-            type=SourceType(data.get('source', {}).get('type', '')),
-            id=data.get('source', {}).get('id', ''),
-            store_with_provider=data.get('source', {}).get('store_with_provider', False),
-            holder_name=data.get('source', {}).get('holder_name', '')
+            type=_source_type(source.get('type', '')),
+            id=source.get('id', ''),
+            store_with_provider=source.get('store_with_provider', False),
+            holder_name=source.get('holder_name', '')
         ),
         reference=data.get('reference'),
         merchant_initiated=data.get('merchant_initiated', False),
-        type=RecurringType(data.get('type', '')) if 'type' in data else None,
-        customer=_create_customer(data.get('customer')) if 'customer' in data else None,
-        statement_description=StatementDescription(**data.get('statement_description', {}))
+        type=_recurring_type(data['type']) if 'type' in data else None,
+        customer=_create_customer(data.get('customer')),
+        statement_description=StatementDescription(**data['statement_description'])
         if 'statement_description' in data else None,
-        three_ds=_create_three_ds(data.get('3ds')) if '3ds' in data else None,
+        three_ds=_create_three_ds(data.get('3ds')),
         override_provider_properties=data.get('override_provider_properties')
     )
 
 
+def _source_type(value: Any) -> SourceType:
+    """Resolve a SourceType from its value."""
+    return _SOURCE_TYPES.get(value) or SourceType(value)
+
+
+def _recurring_type(value: Any) -> RecurringType:
+    """Resolve a RecurringType from its value."""
+    return _RECURRING_TYPES.get(value) or RecurringType(value)
+
+
 def _create_customer(data: Optional[Dict[str, Any]]) -> Optional[Customer]:
     """Create a Customer model from dictionary data."""
     if not data:
@@ -90,5 +112,7 @@ def _create_three_ds(data: Optional[Dict[str, Any]]) -> Optional[ThreeDS]:
     """Create a ThreeDS model from dictionary data."""
     if not data:
         return None
-        
-    return ThreeDS(**{k.lower(): v for k, v in data.items()}) 
\ No newline at end of file
+
+    if _THREE_DS_FIELDS.issuperset(data):
+        return ThreeDS(**data)
+    return ThreeDS(**{k.lower(): v for k, v in data.items()})
@@ -1,17 +1,62 @@
 from typing import Dict, Any, Optional, Union, List, cast
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.retry import Retry
 from ..models import ErrorType, ErrorCode, ErrorResponse
+from .json_utils import dumps, loads
 from orchestration_sdk.exceptions import BasisTheoryError
 
+# Sent with every request; caller-supplied headers take precedence
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# Pooled connections per host, and threads running blocking requests for request_async()
+POOL_SIZE = 50
+
 class RequestClient:
     def __init__(self, bt_api_key: str) -> None:
         self.bt_api_key = bt_api_key
+        # Proxy headers that are the same for every request made by this client
+        self._bt_headers = {"BT-API-KEY": bt_api_key}
+
+        # Keep connections to the BT proxy and provider hosts alive across requests.
+        # Only connection errors are retried, i.e. failures before the request was sent;
+        # every SDK call is a POST without an idempotency key, so a request that reached
+        # the server (including one answered with a 5xx) is never resubmitted.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # request_async() runs on its own executor rather than the loop's default one, so the
+        # number of requests in flight never exceeds the connections the pool can hold
+        self._executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="orchestration-sdk")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session, its pooled connections and the request_async() threads."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
 
     def _is_bt_error(self, response: Response) -> bool:
         """Check if the error is from BasisTheory by comparing status codes."""
         bt_status = response.headers.get('BT-PROXY-DESTINATION-STATUS')
-        return bt_status is None or str(response.status_code) != bt_status
+        if bt_status is None:
+            return True
+        try:
+            return int(bt_status) != response.status_code
+        except ValueError:
+            # A malformed header can't match the status code
+            return True
 
     def _transform_bt_error(self, response: Response) -> ErrorResponse:
         """Transform BasisTheory error response to standardized format."""
@@ -24,9 +69,14 @@ class RequestClient:
         elif response.status_code < 500:
             error_type = ErrorType.BT_REQUEST_ERROR
 
-        try:
-            response_data = response.json()
-        except:
+        # Only attempt a parse when the body is JSON (including application/problem+json)
+        response_data = None
+        if "json" in response.headers.get("Content-Type", ""):
+            try:
+                response_data = loads(response.content)
+            except ValueError:
+                pass
+        if not isinstance(response_data, dict):
             response_data = {"message": response.text or "Unknown error"}
 
         provider_errors: List[str] = []
@@ -52,15 +102,18 @@ class RequestClient:
         url: str,
         method: str = "GET",
         headers: Optional[Dict[str, str]] = None,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         use_bt_proxy: bool = False
     ) -> Response:
         """Make an HTTP request, optionally through the BasisTheory proxy."""
-        request_headers = headers.copy() if headers else {}
+        request_headers = {**DEFAULT_HEADERS, **headers} if headers else DEFAULT_HEADERS.copy()
+
+        # Encode the body once; already-encoded bodies are sent as-is
+        body = data if data is None or isinstance(data, (bytes, bytearray)) else dumps(data)
 
         if use_bt_proxy:
             # Add BT API key and proxy headers
-            request_headers["BT-API-KEY"] = self.bt_api_key
+            request_headers.update(self._bt_headers)
             # Add proxy header only if not already present
             if "BT-PROXY-URL" not in request_headers:
                 request_headers["BT-PROXY-URL"] = url
@@ -70,11 +123,11 @@ class RequestClient:
             request_url = url
 
         # Make the request
-        response = requests.request(
+        response = self._session.request(
             method=method,
             url=request_url,
             headers=request_headers,
-            json=data
+            data=body
         )
 
         # Check for BT errors first
@@ -86,4 +139,30 @@ class RequestClient:
         # Raise for other HTTP errors
         response.raise_for_status()
         
-        return response 
\ No newline at end of file
+        return response
+
+    async def request_async(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        use_bt_proxy: bool = False
+    ) -> Response:
+        """Make an HTTP request like request(), running the blocking call on this client's thread pool.
+
+        This keeps the event loop free while waiting on the network, so concurrent
+        transactions overlap instead of running one after another.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(
+                self.request,
+                url=url,
+                method=method,
+                headers=headers,
+                data=data,
+                use_bt_proxy=use_bt_proxy
+            )
+        )
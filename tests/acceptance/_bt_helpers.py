@@ -0,0 +1,98 @@
+"""Basis Theory tokens and token intents shared by the provider acceptance tests."""
+import os
+import asyncio
+import functools
+import logging
+import time
+import requests
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+from basistheory.api_client import ApiClient # type: ignore
+from basistheory.configuration import Configuration # type: ignore
+from basistheory.api.tokens_api import TokensApi # type: ignore
+from orchestration_sdk.utils.json_utils import loads
+
+logger = logging.getLogger(__name__)
+
+# Read once at import rather than on every token request
+BT_API_KEY = os.getenv('BASISTHEORY_API_KEY', '')
+
+# How long test tokens live
+TOKEN_TTL = timedelta(minutes=10)
+# Cached tokens are replaced once this much of their TTL has passed, so none expires mid-test
+TOKEN_REFRESH_AFTER = TOKEN_TTL * 0.8
+
+
+@functools.lru_cache(maxsize=None)
+def tokens_api() -> TokensApi:
+    """Basis Theory tokens client, created on first use and shared so token requests reuse its connections."""
+    return TokensApi(ApiClient(Configuration(api_key=BT_API_KEY)))
+
+
+def new_bt_token(card_number: str, expiration_year: str, expiration_month: str, cvc: str) -> str:
+    """Create a Basis Theory token for testing."""
+    expires_at = (datetime.now(timezone.utc) + TOKEN_TTL).isoformat(timespec='seconds')
+
+    token = tokens_api().create({
+        "type": "card",
+        "data": {
+            "number": card_number,
+            "expiration_month": expiration_month,
+            "expiration_year": expiration_year,
+            "cvc": cvc
+        },
+        "expires_at": expires_at
+    })
+    return token.id
+
+
+# One token per card at a time, with the monotonic time it was requested; see TOKEN_REFRESH_AFTER
+_bt_tokens: Dict[Tuple[str, str, str, str], Tuple[float, "asyncio.Future[str]"]] = {}
+
+
+async def card_token(card_number: str, expiration_year: str = "2030", expiration_month: str = "03", cvc: str = "737") -> str:
+    """Basis Theory token for a card, shared by later tests until it is close to expiring."""
+    card = (card_number, expiration_year, expiration_month, cvc)
+    cached = _bt_tokens.get(card)
+    if cached is None or time.monotonic() - cached[0] > TOKEN_REFRESH_AFTER.total_seconds():
+        # Stored as a future so concurrent callers wait on the same request instead of creating duplicates
+        loop = asyncio.get_running_loop()
+        cached = (time.monotonic(), loop.run_in_executor(None, new_bt_token, *card))
+        _bt_tokens[card] = cached
+    try:
+        return await cached[1]
+    except Exception:
+        # Don't cache the failure, so the next test asks for a new token, unless another waiter already has
+        if _bt_tokens.get(card) is cached:
+            _bt_tokens.pop(card, None)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def bt_session() -> requests.Session:
+    """HTTP session for Basis Theory API calls the tokens client doesn't cover, shared so they reuse connections."""
+    session = requests.Session()
+    session.headers.update({"BT-API-KEY": BT_API_KEY, "Content-Type": "application/json"})
+    return session
+
+
+async def card_token_intent(card_number: str, cvc: str = "737") -> str:
+    """Create a Basis Theory token intent for a card; a new one every call."""
+    payload = {
+        "type": "card",
+        "data": {
+            "number": card_number,
+            "expiration_month": "03",
+            "expiration_year": "2030",
+            "cvc": cvc
+        }
+    }
+
+    # The blocking call runs in the default executor so concurrent tests keep making progress
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(
+        None, functools.partial(bt_session().post, "https://api.basistheory.com/token-intents", json=payload)
+    )
+    response_data = loads(response.content)
+    logger.debug("Response: %r", response_data)
+    return response_data['id']
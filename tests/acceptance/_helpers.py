@@ -0,0 +1,82 @@
+"""Assertions and request data shared by the provider acceptance tests."""
+from typing import Any, Dict, Optional
+from orchestration_sdk.models import (
+    TransactionStatusCode,
+    ErrorCategory,
+    ErrorType,
+    TransactionRequest,
+    TransactionResponse,
+    ErrorResponse,
+    Address
+)
+
+
+def new_york_address(country: str = 'US') -> Address:
+    """The test customer's street address; some provider cases depend on the country, so it can be overridden."""
+    return Address(address_line1='123 Main St', city='New York', state='NY', zip='10001', country=country)
+
+
+def john_doe() -> Dict[str, Any]:
+    """Customer fields for cases that send a full customer, new on every call; add a fresh reference per request."""
+    return {
+        'first_name': 'John',
+        'last_name': 'Doe',
+        'email': 'john.doe@example.com',
+        'address': new_york_address()
+    }
+
+
+def assert_authorized(response: TransactionResponse, transaction_request: TransactionRequest) -> None:
+    """Assert the shape shared by every authorized transaction, whatever its source type."""
+    assert isinstance(response, TransactionResponse)
+    assert response.id is not None
+    assert response.reference == transaction_request.reference
+
+    # Validate amount
+    assert response.amount is not None
+    assert response.amount.value is not None
+    assert response.amount.currency == 'USD'
+
+    # Validate status
+    assert response.status is not None
+    assert response.status.code == TransactionStatusCode.AUTHORIZED
+    assert response.status.provider_code is not None
+
+    # Validate source
+    assert response.source is not None
+    assert response.source.type == transaction_request.source.type
+    assert response.source.id is not None
+
+    # Validate other fields
+    assert isinstance(response.full_provider_response, dict)
+    assert response.created_at is not None
+
+    # Validate network_transaction_id
+    assert isinstance(response.network_transaction_id, str)
+    assert len(response.network_transaction_id) > 0
+
+
+def assert_error(response: ErrorResponse, category: ErrorCategory, error_type: ErrorType, provider_error: Optional[str]) -> None:
+    """Assert an error response carries exactly one error code and one provider error (none if provider_error is None)."""
+    assert isinstance(response.error_codes, list)
+    assert len(response.error_codes) == 1
+
+    # Verify exact error code values
+    error = response.error_codes[0]
+    assert error.category == category
+    assert error.code == error_type.code
+
+    # Verify provider errors
+    assert isinstance(response.provider_errors, list)
+    assert response.provider_errors == ([provider_error] if provider_error is not None else [])
+
+
+def assert_provisioned(response: TransactionResponse, provisioned: Optional[bool]) -> None:
+    """Stored cards come back with the provider's payment method id; None means the case doesn't check."""
+    if provisioned is None:
+        return
+    if provisioned:
+        assert response.source.provisioned is not None
+        assert response.source.provisioned.id is not None
+    else:
+        assert response.source.provisioned is None
@@ -1,13 +1,10 @@
 # test_sdk.py
 import os
+import asyncio
 import uuid
+import logging
 import pytest
-from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
-from basistheory.api_client import ApiClient # type: ignore
-from basistheory.configuration import Configuration # type: ignore
-from basistheory.api.tokens_api import TokensApi # type: ignore
-from orchestration_sdk import PaymentOrchestrationSDK
+from typing import Any, Dict, Optional
 from orchestration_sdk.models import (
     TransactionStatusCode,
     RecurringType,
@@ -22,320 +19,137 @@ from orchestration_sdk.models import (
     TransactionRequest,
     TransactionResponse,
     ThreeDS,
-    Address,
     TransactionSource,
-    ProvisionedSource
+    ProvisionedSource,
+    ErrorResponse
 )
 from orchestration_sdk.exceptions import TransactionError, ValidationError, BasisTheoryError
+from _bt_helpers import card_token, card_token_intent
+from _helpers import john_doe, assert_authorized, assert_error, assert_provisioned
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-async def create_bt_token(card_number: str = "4111111145551142"):
-    """Create a Basis Theory token for testing."""
-    configuration = Configuration(
-        api_key=os.getenv('BASISTHEORY_API_KEY')
-    )
-    # Calculate expiry time (10 minutes from now)
-    expires_at = (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()
-    
-    with ApiClient(configuration) as api_client:
-        tokens_api = TokensApi(api_client)
-        token = tokens_api.create({
-            "type": "card",
-            "data": {
-                "number": card_number,
-                "expiration_month": "03",
-                "expiration_year": "2030",
-                "cvc": 737
-            },
-            "expires_at": expires_at
-        })
-        return token.id
-
-async def create_bt_token_intent(card_number: str = "4111111145551142"):
-    """Create a Basis Theory token for testing."""
-    import requests
-
-    url = "https://api.basistheory.com/token-intents"
-    headers = {
-        "BT-API-KEY": os.getenv('BASISTHEORY_API_KEY'),
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "type": "card",
-        "data": {
-            "number": card_number,
-            "expiration_month": "03",
-            "expiration_year": "2030",
-            "cvc": 737
-        }
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
-    response_data = response.json()
-    print(f"Response: {response_data}")
-    return response_data['id']
-
-def get_sdk(api_key = os.getenv('ADYEN_API_KEY'), merchant_account = os.getenv('ADYEN_MERCHANT_ACCOUNT')):
-    return PaymentOrchestrationSDK.init({
-        'is_test': True,
-        'bt_api_key': os.getenv('BASISTHEORY_API_KEY'),
-        'provider_config': {
-            'adyen': {
-                'api_key': api_key,
-                'merchant_account': merchant_account,
-            }
-        }
-    })
-
-@pytest.mark.asyncio
-async def test_storing_card_on_file():
-    # Create a Basis Theory token
-    token_id = await create_bt_token()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.UNSCHEDULED,
-        amount=Amount(value=1, currency='USD'),  # Amount in cents (10.00 in this case)
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=True,
-            holder_name='John Doe'
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4()),
-            first_name='John',
-            last_name='Doe',
-            email='john.doe@example.com',
-            address=Address(
-                address_line1='123 Main St',
-                city='New York',
-                state='NY',
-                zip='10001',
-                country='US'
-            )
-        )
-    )
-
-
-    # Make the transaction request
-    response = await sdk.adyen.transaction(transaction_request)
-    print(f"Response: {response.full_provider_response}")
+_REQUIRED_ENV = ('BASISTHEORY_API_KEY', 'ADYEN_API_KEY', 'ADYEN_MERCHANT_ACCOUNT')
+pytestmark = pytest.mark.skipif(
+    not all(os.getenv(name) for name in _REQUIRED_ENV),
+    reason=f"Adyen acceptance tests need {', '.join(_REQUIRED_ENV)} set"
+)
 
-    # Validate response structure
-    assert isinstance(response, TransactionResponse)
-    assert response.id is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN
-    assert response.source.id is not None
-    assert response.source.provisioned is not None
-    assert response.source.provisioned.id is not None
-    
-    # Validate other fields
-    assert response.full_provider_response is not None
-    assert isinstance(response.full_provider_response, dict)
-    
-    assert response.created_at is not None
 
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
+# Card the tests pay with unless a case says otherwise
+CARD_NUMBER = "4111111145551142"
 
 
-@pytest.mark.asyncio
-async def test_not_storing_card_on_file():
-    # Create a Basis Theory token
-    token_id = await create_bt_token()
+async def source_id_for(case: Dict[str, Any]) -> str:
+    """Source id for a case: a fixed processor token, a new token intent, or a Basis Theory token for its card."""
+    if 'source_id' in case:
+        return case['source_id']
+    if case.get('source_type') == SourceType.BASIS_THEORY_TOKEN_INTENT:
+        return await card_token_intent(CARD_NUMBER)
+    return await card_token(case.get('card_number', CARD_NUMBER))
 
-    # Initialize the SDK with environment variables
-    sdk = get_sdk(); 
 
-    
-    transaction_request = TransactionRequest(
+def transaction_request_for(source_id: str, case: Dict[str, Any]) -> TransactionRequest:
+    """Build a 1 cent USD transaction for a payment source (a Basis Theory token by default), applying the case's overrides."""
+    return TransactionRequest(
         reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,  # Amount in cents (10.00 in this case)
-            currency='USD'
-        ),
+        type=case.get('type', RecurringType.ONE_TIME),
+        merchant_initiated=case.get('merchant_initiated', False),
+        amount=Amount(value=1, currency='USD'),
         source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False
+            type=case.get('source_type', SourceType.BASIS_THEORY_TOKEN),
+            id=source_id,
+            store_with_provider=case.get('store_with_provider', False),
+            holder_name=case.get('holder_name')
         ),
-        customer=Customer(
-            reference=str(uuid.uuid4())
-        )
+        # A case's 'customer' is a factory, so no two requests share the same Customer fields
+        customer=Customer(reference=case.get('customer_reference', str(uuid.uuid4())), **(case['customer']() if 'customer' in case else {})),
+        three_ds=case.get('three_ds')
     )
 
-    # Make the transaction request
-    response = await sdk.adyen.transaction(transaction_request)
-    print(f"Response: {response.full_provider_response}")
-
-    # Validate response structure
-    assert isinstance(response, TransactionResponse)
-    assert response.id is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN
-    assert response.source.id is not None
-    assert response.source.provisioned is None
-
-    # Validate other fields
-    assert response.full_provider_response is not None
-    assert isinstance(response.full_provider_response, dict)
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
 
-
-@pytest.mark.asyncio
-async def test_with_three_ds():
-    # Create a Basis Theory token
-    token_id = await create_bt_token("4917610000000000")
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,  # Amount in cents (10.00 in this case)
-            currency='USD'
-        ),
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4())
-        ),
-        three_ds=ThreeDS(
-            eci='05',
-            authentication_value='AAABCZIhcQAAAABZlyFxAAAAAAA=',
-            xid='AAABCZIhcQAAAABZlyFxAAAAAAA=',
-            version='2.2.0'
-        )
+AUTHORIZED_CASES = [
+    pytest.param(
+        {
+            'type': RecurringType.UNSCHEDULED,
+            'store_with_provider': True,
+            'holder_name': 'John Doe',
+            'customer': john_doe
+        },
+        True,
+        id='storing_card_on_file'
+    ),
+    pytest.param({}, False, id='not_storing_card_on_file'),
+    pytest.param(
+        {
+            'card_number': '4917610000000000',
+            'three_ds': ThreeDS(
+                eci='05',
+                authentication_value='AAABCZIhcQAAAABZlyFxAAAAAAA=',
+                xid='AAABCZIhcQAAAABZlyFxAAAAAAA=',
+                version='2.2.0'
+            )
+        },
+        None,
+        id='with_three_ds'
+    ),
+    pytest.param(
+        {'source_type': SourceType.BASIS_THEORY_TOKEN_INTENT},
+        False,
+        id='token_intent_not_storing_card_on_file'
+    ),
+    pytest.param(
+        {
+            'source_type': SourceType.PROCESSOR_TOKEN,
+            'source_id': 'M7HP6FRCWCGZZCV5',
+            'type': RecurringType.UNSCHEDULED,
+            'merchant_initiated': True,
+            'customer_reference': 'a57c211b-d6d2-47c6-a7e9-0ca39b2f3acf'
+        },
+        False,
+        id='processor_token_not_storing_card_on_file'
     )
+]
 
-    # Make the transaction request
-    response = await sdk.adyen.transaction(transaction_request)
-    print(f"Response: {response.full_provider_response}")
 
-    # Validate response structure
-    assert isinstance(response, TransactionResponse)
-    assert response.id is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN
-    assert response.source.id is not None
+@pytest.mark.asyncio
+async def test_authorized_transactions(sdk):
+    # Every case is sent once, all at once; total time is roughly the slowest round trip rather than the sum
+    cases = [(param.id, *param.values) for param in AUTHORIZED_CASES]
 
+    # Create every case's payment source at once; cases sharing a card wait on the same token
+    source_ids = await asyncio.gather(*(source_id_for(case) for _, case, _ in cases))
+    transaction_requests = [transaction_request_for(source_id, case) for source_id, (_, case, _) in zip(source_ids, cases)]
 
-    # Validate other fields
-    assert response.full_provider_response is not None
+    responses = await sdk.adyen.transaction_many(transaction_requests)
 
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert len(response.network_transaction_id) > 0
+    for (case_id, _, provisioned), transaction_request, response in zip(cases, transaction_requests, responses):
+        logger.debug("Response for %s: %r", case_id, response)
+        # transaction_many returns a failed case's exception in its place rather than raising it
+        assert not isinstance(response, BaseException), f"{case_id} failed: {response!r}"
+        assert_authorized(response, transaction_request)
+        assert_provisioned(response, provisioned)
+        assert response.amount.value == transaction_request.amount.value
+        assert response.status.provider_code == 'Authorised'
+        assert response.source.id == transaction_request.source.id
 
 
 @pytest.mark.asyncio
-async def test_error_expired_card():
+async def test_error_expired_card(sdk):
     # Create a Basis Theory token
-    token_id = await create_bt_token()
+    token_id = await card_token(CARD_NUMBER)
 
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    transaction_request = transaction_request_for(token_id, {'holder_name': 'CARD_EXPIRED'})
 
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,  # Amount in cents (10.00 in this case)
-            currency='USD'
-        ),
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False,
-            holder_name='CARD_EXPIRED'
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4())
-        )
-    )
-
-    print(f"Transaction request: {transaction_request}")
+    logger.debug("Transaction request: %r", transaction_request)
     # Make the transaction request and catch TransactionError
-    try:
-        response = await sdk.adyen.transaction(transaction_request)
-        print(f"Response: {response}")
-    except TransactionError as e:
-        response = e.error_response
-        print(f"Error Response: {response}")
+    with pytest.raises(TransactionError) as exc_info:
+        await sdk.adyen.transaction(transaction_request)
+    response = exc_info.value.error_response
+    logger.debug("Error Response: %r", response)
+
+    assert_error(response, ErrorCategory.PAYMENT_METHOD_ERROR, ErrorType.EXPIRED_CARD, 'Expired Card')
 
-    # Validate error response structure
-    assert isinstance(response.error_codes, list)
-    assert len(response.error_codes) == 1
-    
-    # Verify exact error code values
-    error = response.error_codes[0]
-    assert error.category == ErrorCategory.PAYMENT_METHOD_ERROR
-    assert error.code == ErrorType.EXPIRED_CARD.code
-    
-    # Verify provider errors
-    assert isinstance(response.provider_errors, list)
-    assert len(response.provider_errors) == 1
-    assert response.provider_errors[0] == 'Expired Card'
-    
     # Verify full provider response
     assert isinstance(response.full_provider_response, dict)
     assert response.full_provider_response['resultCode'] == 'Refused'
@@ -343,49 +157,26 @@ async def test_error_expired_card():
     assert response.full_provider_response['refusalReasonCode'] == '6'
 
 @pytest.mark.asyncio
-async def test_error_invalid_api_key():
+async def test_error_invalid_api_key(init_sdk):
     # Create a Basis Theory token
-    token_id = await create_bt_token()
+    token_id = await card_token(CARD_NUMBER)
 
-    # Initialize the SDK with environment variables
-    sdk = get_sdk('invalid', 'nope');
+    # Initialize the SDK with an invalid Adyen API key
+    sdk = init_sdk(adyen={'api_key': 'invalid', 'merchant_account': 'nope'})
 
-    # Create a test transaction request
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.ONE_TIME,
-        amount=Amount(value=1, currency='USD'),  # Amount in cents (10.00 in this case)
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False,
-            holder_name='CARD_EXPIRED'
-        ),
-        customer=Customer(reference=str(uuid.uuid4()))
-    )
+    transaction_request = transaction_request_for(token_id, {'holder_name': 'CARD_EXPIRED'})
 
-    print(f"Transaction request: {transaction_request}")
+    logger.debug("Transaction request: %r", transaction_request)
     # Make the transaction request and catch BasisTheoryException
     try:
         response = await sdk.adyen.transaction(transaction_request)
-        print(f"Response: {response}")
+        logger.debug("Response: %r", response)
     except TransactionError as e:
         response = e.error_response
-        print(f"BasisTheory Error Response: {response}")
+        logger.debug("BasisTheory Error Response: %r", response)
+
+    assert_error(response, ErrorCategory.OTHER, ErrorType.INVALID_API_KEY, 'HTTP Status Response - Unauthorized')
 
-    # Validate error response structure
-    assert isinstance(response.error_codes, list)
-    assert len(response.error_codes) == 1
-    
-    # Verify exact error code values
-    error = response.error_codes[0]
-    assert error.category == ErrorCategory.OTHER
-    assert error.code == ErrorType.INVALID_API_KEY.code
-    
-    # Verify provider errors
-    assert len(response.provider_errors) == 1
-    assert response.provider_errors[0] == 'HTTP Status Response - Unauthorized'
-    
     # Verify full provider response
     assert response.full_provider_response['status'] == 401
     assert response.full_provider_response['errorCode'] == '000'
@@ -393,113 +184,9 @@ async def test_error_invalid_api_key():
     assert response.full_provider_response['message'] == 'HTTP Status Response - Unauthorized'
 
 @pytest.mark.asyncio
-async def test_token_intents_charge_not_storing_card_on_file(): 
-    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.ONE_TIME,
-        amount=Amount(value=1, currency='USD'),  # Amount in cents (0.01 in this case)
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN_INTENT,
-            id=token_intent_id,
-            store_with_provider=False
-        ),
-        customer=Customer(reference=str(uuid.uuid4()))
-    )
-
-    # Make the transaction request
-    response = await sdk.adyen.transaction(transaction_request)
-    print(f"Response: {response.full_provider_response}")
-
-    # Validate response structure
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount.value == transaction_request.amount.value
-    assert response.amount.currency == transaction_request.amount.currency
-    
-    # Validate status
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code == 'Authorised'
-    
-    # Validate source
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN_INTENT
-    assert response.source.id == token_intent_id
-    assert response.source.provisioned is None
-
-    # Validate other fields
-    assert response.full_provider_response is not None
-    assert isinstance(response.full_provider_response, dict)
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
-
-
-@pytest.mark.asyncio
-async def test_processor_token_charge_not_storing_card_on_file(): 
-    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),  # Unique reference for the transaction
-        type=RecurringType.UNSCHEDULED,
-        merchant_initiated=True,
-        amount=Amount(value=1, currency='USD'),  # Amount in cents (0.01 in this case)
-        source=Source(
-            type=SourceType.PROCESSOR_TOKEN,
-            id='M7HP6FRCWCGZZCV5'
-        ),
-        customer=Customer(
-            reference="a57c211b-d6d2-47c6-a7e9-0ca39b2f3acf"
-        )
-    )
-
-    # Make the transaction request
-    response = await sdk.adyen.transaction(transaction_request)
-    print(f"Response: {response.full_provider_response}")
-
-    # Validate response structure
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount.value == transaction_request.amount.value
-    assert response.amount.currency == transaction_request.amount.currency
-    
-    # Validate status
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code == 'Authorised'
-    
-    # Validate source
-    assert response.source.type == SourceType.PROCESSOR_TOKEN
-    assert response.source.id == transaction_request.source.id
-    assert response.source.provisioned is None
-    # Validate other fields
-    assert response.full_provider_response is not None
-    assert isinstance(response.full_provider_response, dict)
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
-
-@pytest.mark.asyncio
-async def test_partial_refund():
+async def test_partial_refund(sdk):
    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_intent_id = await card_token_intent(CARD_NUMBER)
 
     # Create a test transaction with a processor token
     transaction_request = TransactionRequest(
@@ -1,10 +1,9 @@
 # test_sdk.py
 import os
 import uuid
+import logging
 import pytest
 from datetime import datetime
-from dotenv import load_dotenv
-from orchestration_sdk import PaymentOrchestrationSDK
 from orchestration_sdk.models import (
     TransactionResponse,
     TransactionStatus,
@@ -21,22 +20,13 @@ from orchestration_sdk.models import (
 )
 from orchestration_sdk.exceptions import BasisTheoryError
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.asyncio
-async def test_error_invalid_api_key():
-    # Initialize the SDK with environment variables
-    sdk = PaymentOrchestrationSDK.init({
-        'is_test': True,
-        'bt_api_key': "invalid",
-        'provider_config': {
-            'adyen': {
-                'api_key': "invalid",
-                'merchant_account': "nope",
-            }
-        }
-    })
+async def test_error_invalid_api_key(init_sdk):
+    # Initialize the SDK with an invalid Basis Theory API key
+    sdk = init_sdk(bt_api_key='invalid', adyen={'api_key': 'invalid', 'merchant_account': 'nope'})
 
     # Create a test transaction request
     transaction_request = TransactionRequest(
@@ -58,7 +48,7 @@ async def test_error_invalid_api_key():
     )
 
 
-    print(f"Transaction request: {transaction_request}")
+    logger.debug("Transaction request: %r", transaction_request)
 
     # Make the transaction request and expect a BasisTheoryError
     with pytest.raises(BasisTheoryError) as exc_info:
@@ -1,15 +1,10 @@
 # test_sdk.py
 import os
-import json
 import uuid
+import logging
 import asyncio
 import pytest
-from datetime import datetime, timedelta, timezone
-from dotenv import load_dotenv
-from basistheory.api_client import ApiClient # type: ignore
-from basistheory.configuration import Configuration # type: ignore
-from basistheory.api.tokens_api import TokensApi # type: ignore
-from orchestration_sdk import PaymentOrchestrationSDK
+from typing import Any, Dict
 from orchestration_sdk.models import (
     TransactionResponse,
     TransactionStatus,
@@ -26,285 +21,96 @@ from orchestration_sdk.models import (
     Customer,
     Address,
     ThreeDS,
-    TransactionRequest,
-    TransactionResponse,
-    TransactionStatusCode,
-    RecurringType,
-    RefundRequest,
-    RefundResponse,
-    ErrorCategory,
-    ErrorType
+    TransactionRequest
 )
 from orchestration_sdk.exceptions import TransactionError, ValidationError
+from _bt_helpers import card_token, card_token_intent
+from _helpers import john_doe, new_york_address, assert_authorized, assert_error, assert_provisioned
 
-# Load environment variables from .env file
-load_dotenv()
-
-
-async def create_bt_token(card_number: str = "4242424242424242", expiration_year: str = "2030", expiration_month: str = "03", cvc: str = "100"):
-    """Create a Basis Theory token for testing."""
-    configuration = Configuration(
-        api_key=os.getenv('BASISTHEORY_API_KEY')
-    )
-    # Calculate expiry time (10 minutes from now)
-    expires_at = (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()
-    
-    with ApiClient(configuration) as api_client:
-        tokens_api = TokensApi(api_client)
-        token = tokens_api.create({
-            "type": "card",
-            "data": {
-                "number": card_number,
-                "expiration_month": expiration_month,
-                "expiration_year": expiration_year,
-                "cvc": cvc
-            },
-            "expires_at": expires_at
-        })
-        return token.id
-
-async def create_bt_token_intent(card_number: str = "4242424242424242", cvc: str = "737"):
-    """Create a Basis Theory token for testing."""
-    import requests
-
-    url = "https://api.basistheory.com/token-intents"
-    headers = {
-        "BT-API-KEY": os.getenv('BASISTHEORY_API_KEY'),
-        "Content-Type": "application/json"
-    }
-    payload = {
-        "type": "card",
-        "data": {
-            "number": card_number,
-            "expiration_month": "03",
-            "expiration_year": "2030",
-            "cvc": cvc
-        }
-    }
-
-    response = requests.post(url, headers=headers, json=payload)
-    response_data = response.json()
-    print(f"Response: {response_data}")
-    return response_data['id']
-
-def get_sdk(processing_channel = os.getenv('CHECKOUT_PROCESSING_CHANNEL'), private_key = os.getenv('CHECKOUT_PRIVATE_KEY')):
-    return PaymentOrchestrationSDK.init({
-        'is_test': True,
-        'bt_api_key': os.getenv('BASISTHEORY_API_KEY'),
-        'provider_config': {
-            'checkout': {
-                'private_key': private_key,
-                'processing_channel': processing_channel
-            }
-        }
-    })  
-
-@pytest.mark.asyncio
-async def test_storing_card_on_file():
-    # Create a Basis Theory token
-    token_id = await create_bt_token()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk()
-
-    # Create transaction request
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),
-        type=RecurringType.UNSCHEDULED,
-        amount=Amount(
-            value=100,
-            currency='USD'
-        ),
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=True,
-            holder_name='John Doe'
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4()),
-            first_name='John',
-            last_name='Doe',
-            email='john.doe@example.com',
-            address=Address(
-                address_line1='123 Main St',
-                city='New York',
-                state='NY',
-                zip='10001',
-                country='US'
-            )
-        )
-    )
-
-    # Make the transaction request
-    response = await sdk.checkout.transaction(transaction_request)
-
-    # Validate response structure
-    assert response.id is not None
-    assert response.reference is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type in [SourceType.BASIS_THEORY_TOKEN]
-    assert response.source.id is not None
-    assert response.source.provisioned is not None
-    assert response.source.provisioned.id is not None
+logger = logging.getLogger(__name__)
 
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert len(response.network_transaction_id) > 0
+# Read once at import; the US channel is the default the shared SDK is configured with
+CHECKOUT_PROCESSING_CHANNEL_EU = os.getenv('CHECKOUT_PROCESSING_CHANNEL_EU')
 
-    # Validate other fields
-    assert response.full_provider_response is not None
-    
-    assert response.created_at is not None
+# Card the tests pay with unless they say otherwise; tokens use CARD_CVC, token intents the helper's default
+CARD_NUMBER = "4242424242424242"
+CARD_CVC = "100"
 
 
-@pytest.mark.asyncio
-async def test_not_storing_card_on_file():
-    # Create a Basis Theory token
-    token_id = await create_bt_token()
+async def source_id_for(case: Dict[str, Any]) -> str:
+    """Source id for a case: a new token intent, or a Basis Theory token for the default card."""
+    if case.get('source_type') == SourceType.BASIS_THEORY_TOKEN_INTENT:
+        return await card_token_intent(CARD_NUMBER)
+    return await card_token(CARD_NUMBER, cvc=CARD_CVC)
 
-    # Initialize the SDK with environment variables
-    sdk = get_sdk()
 
-    transaction_request = TransactionRequest(
+def transaction_request_for(source_id: str, case: Dict[str, Any]) -> TransactionRequest:
+    """Build a USD transaction (1 cent unless the case says otherwise) for a payment source, applying the case's overrides."""
+    return TransactionRequest(
         reference=str(uuid.uuid4()),
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,
-            currency='USD'
-        ),
+        type=case.get('type', RecurringType.ONE_TIME),
+        amount=Amount(value=case.get('amount', 1), currency='USD'),
         source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False
+            type=case.get('source_type', SourceType.BASIS_THEORY_TOKEN),
+            id=source_id,
+            store_with_provider=case.get('store_with_provider', False),
+            holder_name=case.get('holder_name')
         ),
-        customer=Customer(
-            reference=str(uuid.uuid4())
-        )
+        # A case's 'customer' is a factory, so no two requests share the same Customer fields
+        customer=Customer(reference=str(uuid.uuid4()), **(case['customer']() if 'customer' in case else {})),
+        three_ds=case.get('three_ds')
     )
 
-    # Make the transaction request
-    response = await sdk.checkout.transaction(transaction_request)
-
-    # Validate response structure
-    assert response.id is not None
-    assert response.reference is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN
-    assert response.source.id is not None
-    assert response.source.provisioned is None
 
-    # Validate other fields
-    assert response.full_provider_response is not None
+AUTHORIZED_CASES = [
+    pytest.param(
+        {
+            'type': RecurringType.UNSCHEDULED,
+            'amount': 100,
+            'store_with_provider': True,
+            'holder_name': 'John Doe',
+            'customer': john_doe
+        },
+        True,
+        id='storing_card_on_file'
+    ),
+    pytest.param({}, False, id='not_storing_card_on_file'),
+    pytest.param(
+        {
+            'customer': lambda: {'address': new_york_address('CA')},
+            'three_ds': ThreeDS(
+                eci='05',
+                authentication_value='AAABCZIhcQAAAABZlyFxAAAAAAA=',
+                xid='AAABCZIhcQAAAABZlyFxAAAAAAA=',
+                version='2.2.0'
+            )
+        },
+        False,
+        id='with_three_ds'
+    ),
+    pytest.param(
+        {'source_type': SourceType.BASIS_THEORY_TOKEN_INTENT},
+        False,
+        id='token_intent_not_storing_card_on_file'
+    )
+]
 
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert len(response.network_transaction_id) > 0
 
 @pytest.mark.asyncio
-async def test_with_three_ds():
-    # Create a Basis Theory token
-    token_id = await create_bt_token("4242424242424242")
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    # Create transaction request
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,
-            currency='USD'
-        ),
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN,
-            id=token_id,
-            store_with_provider=False
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4()),
-            address=Address(
-                address_line1='123 Main St',
-                city='New York', 
-                state='NY',
-                zip='10001',
-                country='CA'
-            )
-        ),
-        three_ds=ThreeDS(
-            eci='05',
-            authentication_value='AAABCZIhcQAAAABZlyFxAAAAAAA=',
-            xid='AAABCZIhcQAAAABZlyFxAAAAAAA=',
-            version='2.2.0'
-        )
-    )
+@pytest.mark.parametrize('case, provisioned', AUTHORIZED_CASES)
+async def test_authorized_transaction(sdk, case, provisioned):
+    transaction_request = transaction_request_for(await source_id_for(case), case)
 
     # Make the transaction request
     response = await sdk.checkout.transaction(transaction_request)
 
-    # Validate response structure
-    assert response.id is not None
-    assert response.reference is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN
-    assert response.source.id is not None
-    assert response.source.provisioned is None
-
-    # Validate other fields
-    assert response.full_provider_response is not None
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
+    assert_authorized(response, transaction_request)
+    assert_provisioned(response, provisioned)
 
 @pytest.mark.asyncio
-async def test_error_expired_card():
+async def test_error_expired_card(sdk):
     # Create a Basis Theory token
-    token_id = await create_bt_token("4724117215951699", "2024", "03", "100")
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_id = await card_token("4724117215951699", "2024", "03", CARD_CVC)
 
     transaction_request = TransactionRequest(
         reference=str(uuid.uuid4()),  # Unique reference for the transaction
@@ -320,17 +126,11 @@ async def test_error_expired_card():
         ),
         customer=Customer(
             reference=str(uuid.uuid4()),
-            address=Address(
-                address_line1='123 Main St',
-                city='New York', 
-                state='NY',
-                zip='10001',
-                country='GB'
-            )
+            address=new_york_address('GB')
         )
     )
 
-    print(f"Transaction request: {transaction_request}")
+    logger.debug("Transaction request: %r", transaction_request)
 
     # Make the transaction request and expect a TransactionError
     with pytest.raises(TransactionError) as exc_info:
@@ -338,33 +138,22 @@ async def test_error_expired_card():
 
     # Get the error response from the exception
     error_response = exc_info.value.error_response
-    print(f"Error Response: {json.dumps(error_response.full_provider_response, indent=2)}")
+    logger.debug("Error Response: %r", error_response.full_provider_response)
+
+    assert_error(error_response, ErrorCategory.PAYMENT_METHOD_ERROR, ErrorType.EXPIRED_CARD, 'card_expired')
 
-    # Validate error response structure
-    assert len(error_response.error_codes) == 1
-    
-    # Verify exact error code values
-    error = error_response.error_codes[0]
-    assert error.category == ErrorCategory.PAYMENT_METHOD_ERROR
-    assert error.code == ErrorType.EXPIRED_CARD.code
-    
-    # Verify provider errors
-    assert isinstance(error_response.provider_errors, list)
-    assert len(error_response.provider_errors) == 1
-    assert error_response.provider_errors == ['card_expired']
-    
     # Verify full provider response
     assert isinstance(error_response.full_provider_response, dict)
     assert error_response.full_provider_response['error_type'] == 'processing_error'
     assert error_response.full_provider_response['error_codes'] == ['card_expired']
 
 @pytest.mark.asyncio
-async def test_error_invalid_api_key():
+async def test_error_invalid_api_key(init_sdk):
     # Create a Basis Theory token
-    token_id = await create_bt_token()
+    token_id = await card_token(CARD_NUMBER, cvc=CARD_CVC)
 
-    # Initialize the SDK with environment variables
-    sdk = get_sdk('invalid', 'nope');
+    # Initialize the SDK with an invalid Checkout.com private key
+    sdk = init_sdk(checkout={'processing_channel': 'invalid', 'private_key': 'nope'})
 
     # Create a test transaction request
     transaction_request = TransactionRequest(
@@ -385,7 +174,7 @@ async def test_error_invalid_api_key():
         )
     )
 
-    print(f"Transaction request: {transaction_request}")
+    logger.debug("Transaction request: %r", transaction_request)
 
     # Make the transaction request and expect a TransactionError
     with pytest.raises(TransactionError) as exc_info:
@@ -393,87 +182,17 @@ async def test_error_invalid_api_key():
 
     # Get the error response from the exception
     error_response = exc_info.value.error_response
-    print(f"Error Response: {error_response}")
+    logger.debug("Error Response: %r", error_response)
+
+    assert_error(error_response, ErrorCategory.OTHER, ErrorType.INVALID_API_KEY, None)
 
-    # Validate error response structure
-    assert len(error_response.error_codes) == 1
-    
-    # Verify exact error code values
-    error = error_response.error_codes[0]
-    assert error.category == ErrorCategory.OTHER
-    assert error.code == ErrorType.INVALID_API_KEY.code
-    
-    # Verify provider errors
-    assert isinstance(error_response.provider_errors, list)
-    assert len(error_response.provider_errors) == 0
-    
     # Verify full provider response
     assert error_response.full_provider_response is None
 
 @pytest.mark.asyncio
-async def test_token_intents_charge_not_storing_card_on_file(): 
+async def test_processor_token_charge_not_storing_card_on_file(sdk): 
     # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
-
-    # Create transaction request
-    transaction_request = TransactionRequest(
-        reference=str(uuid.uuid4()),
-        type=RecurringType.ONE_TIME,
-        amount=Amount(
-            value=1,
-            currency='USD'
-        ),
-        source=Source(
-            type=SourceType.BASIS_THEORY_TOKEN_INTENT,
-            id=token_intent_id,
-            store_with_provider=False
-        ),
-        customer=Customer(
-            reference=str(uuid.uuid4())
-        )
-    )
-
-    # Make the transaction request
-    response = await sdk.checkout.transaction(transaction_request)
-
-    # Validate response structure
-    assert response.id is not None
-    assert response.reference is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.BASIS_THEORY_TOKEN_INTENT
-    assert response.source.id is not None
-    assert response.source.provisioned is None
-
-    # Validate other fields
-    assert response.full_provider_response is not None
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert len(response.network_transaction_id) > 0
-
-@pytest.mark.asyncio
-async def test_processor_token_charge_not_storing_card_on_file(): 
-    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_intent_id = await card_token_intent(CARD_NUMBER)
 
     # Create initial transaction to get processor token
     transaction_request = TransactionRequest(
@@ -488,16 +207,7 @@ async def test_processor_token_charge_not_storing_card_on_file():
         ),
         customer=Customer(
             reference=str(uuid.uuid4()),
-            first_name='John',
-            last_name='Doe',
-            email='john.doe@example.com',
-            address=Address(
-                address_line1='123 Main St',
-                city='New York',
-                state='NY',
-                zip='10001',
-                country='US'
-            )
+            **john_doe()
         )
     )
 
@@ -524,44 +234,15 @@ async def test_processor_token_charge_not_storing_card_on_file():
     # Make the transaction request
     response = await sdk.checkout.transaction(transaction_request)
 
-    # Validate response structure
-    assert response.id is not None
-    assert response.reference is not None
-    assert response.reference == transaction_request.reference
-    
-    # Validate amount
-    assert response.amount is not None
-    assert response.amount.value is not None
-    assert response.amount.currency == 'USD'
-    
-    # Validate status
-    assert response.status is not None
-    assert response.status.code == TransactionStatusCode.AUTHORIZED
-    assert response.status.provider_code is not None
-    
-    # Validate source
-    assert response.source is not None
-    assert response.source.type == SourceType.PROCESSOR_TOKEN
-    assert response.source.id is not None
+    assert_authorized(response, transaction_request)
     assert response.source.provisioned is not None
     assert response.source.provisioned.id == token_id
 
-    # Validate other fields
-    assert response.full_provider_response is not None
-
-    # Validate network_transaction_id
-    assert response.network_transaction_id is not None
-    assert isinstance(response.network_transaction_id, str)
-    assert len(response.network_transaction_id) > 0
-
 
 @pytest.mark.asyncio
-async def test_partial_refund():
+async def test_partial_refund(sdk):
    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_intent_id = await card_token_intent(CARD_NUMBER)
 
     # Create a test transaction with a processor token
     transaction_request = TransactionRequest(
@@ -598,12 +279,9 @@ async def test_partial_refund():
     assert refund_response.status.code == TransactionStatusCode.RECEIVED
 
 @pytest.mark.asyncio
-async def test_failed_refund():
+async def test_failed_refund(sdk):
    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_intent_id = await card_token_intent(CARD_NUMBER)
 
     # Create a test transaction with a processor token
     transaction_request = TransactionRequest(
@@ -644,12 +322,9 @@ async def test_failed_refund():
 
 
 @pytest.mark.asyncio
-async def test_failed_refund_amount_exceeds_balance():
+async def test_failed_refund_amount_exceeds_balance(sdk):
    # Create a Basis Theory token
-    token_intent_id = await create_bt_token_intent()
-
-    # Initialize the SDK with environment variables
-    sdk = get_sdk();
+    token_intent_id = await card_token_intent(CARD_NUMBER)
 
     # Create a test transaction with a processor token
     transaction_request = TransactionRequest(
@@ -689,82 +364,104 @@ async def test_failed_refund_amount_exceeds_balance():
     assert error_response.error_codes[0].code == 'refund_amount_exceeds_balance'
 
 
-async def run_transactions_for_list(channel, transactions):
-    sdk = get_sdk(channel)
-
-   # Process each transaction
-    for tx_data in transactions:
-        print(f"Processing transaction: {tx_data['card_number']}")
-        # Create a Basis Theory token for each card number
-        token_id = await create_bt_token_intent(tx_data['card_number'], tx_data['cvc'])
-
-        # Convert amount to cents (multiply by 100 and round)
-        amount_cents = round(tx_data['amount'] * 100)
-
-        # Create a test transaction request
-        transaction_request = {
-            'reference': tx_data['reference'],
-            'type': RecurringType.ONE_TIME,
-            'amount': {
-                'value': amount_cents,
-                'currency': tx_data['currency']
-            },
-            'source': {
-                'type': 'basis_theory_token_intent',
-                'id': token_id,
-                'store_with_provider': False,
-                'holder_name': f"{tx_data['first_name']} {tx_data['last_name']}"
-            },
-            'customer': {
-                'reference': str(uuid.uuid4()),
-                'first_name': tx_data['first_name'],
-                'last_name': tx_data['last_name'],
-                'email': tx_data['email'],
-                'address': {
-                    'address_line1': tx_data['address'],
-                    'address_line2': tx_data['address2'] if tx_data['address2'] else None,
-                    'city': tx_data['city'],
-                    'state': tx_data['state'],
-                    'zip': tx_data['zip'],
-                    'country': tx_data['country']
-                }
-            }
-        }
+async def run_transaction(sdk, tx_data):
+    logger.debug("Processing transaction: %s", tx_data['card_number'])
+    # Create a Basis Theory token for each card number
+    token_id = await card_token_intent(tx_data['card_number'], tx_data['cvc'])
 
-        # Make the transaction request
-        response = await sdk.checkout.transaction(transaction_request)
-        print(f"Response for reference {tx_data['reference']}: {response}")
+    # Create a test transaction request, with the amount converted to cents
+    transaction_request = TransactionRequest(
+        reference=tx_data['reference'],
+        type=RecurringType.ONE_TIME,
+        amount=Amount(value=round(tx_data['amount'] * 100), currency=tx_data['currency']),
+        source=Source(
+            type=SourceType.BASIS_THEORY_TOKEN_INTENT,
+            id=token_id,
+            store_with_provider=False,
+            holder_name=f"{tx_data['first_name']} {tx_data['last_name']}"
+        ),
+        customer=Customer(
+            reference=str(uuid.uuid4()),
+            first_name=tx_data['first_name'],
+            last_name=tx_data['last_name'],
+            email=tx_data['email'],
+            address=Address(
+                address_line1=tx_data['address'],
+                address_line2=tx_data['address2'] or None,
+                city=tx_data['city'],
+                state=tx_data['state'],
+                zip=tx_data['zip'],
+                country=tx_data['country']
+            )
+        )
+    )
+
+    # Make the transaction request
+    response = await sdk.checkout.transaction(transaction_request)
+    logger.debug("Response for reference %s: %r", tx_data['reference'], response)
+
+    # Validate response structure
+    assert isinstance(response, TransactionResponse)
+    assert response.reference == transaction_request.reference
+
+    if 'refund' in tx_data:
+        refund_request = RefundRequest(
+            original_transaction_id=response.id,
+            reference=tx_data['refund']['reference'],
+            amount=Amount(value=round(tx_data['refund']['amount'] * 100), currency=tx_data['currency'])
+        )
+
+        refund_response = await sdk.checkout.refund_transaction(refund_request)
+        logger.debug("Refund response for reference %s: %r", tx_data['reference'], refund_response)
+
+        assert isinstance(refund_response, RefundResponse)
+        assert refund_response.reference == refund_request.reference
 
-        # Validate response structure
-        assert isinstance(response, dict)
-        assert 'reference' in response
-        assert response['reference'] == transaction_request['reference']
 
-        if 'refund' in tx_data:
-            refund_request = {
-                'reference': tx_data['refund']['reference'],
-                'amount': round(tx_data['refund']['amount'] * 100)
+async def run_transactions_for_list(sdk, transactions, concurrency=10):
+    # The transactions are independent, so run them together, with at most `concurrency` in flight
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(tx_data):
+        async with semaphore:
+            await run_transaction(sdk, tx_data)
+
+    await asyncio.gather(*(run(tx_data) for tx_data in transactions))
+
+
+@pytest.mark.asyncio
+async def test_run_transactions_for_list(sdk):
+    transactions = [
+        {
+            'reference': str(uuid.uuid4()), 'currency': 'USD', 'amount': 1.25,
+            'card_number': '4242424242424242', 'cvc': '737', 'first_name': 'John', 'last_name': 'Doe',
+            'email': 'john.doe@example.com', 'address': '123 Main St', 'address2': '',
+            'city': 'New York', 'state': 'NY', 'zip': '10001', 'country': 'US', 'refund': {
+                'reference': str(uuid.uuid4()),
+                'amount': 1.25
             }
-            
-            refund_response = await sdk.checkout.refund_transaction(response['id'], refund_request)   
-            print(f"Refund response for reference {tx_data['reference']}: {refund_response}")
+        },
+        {
+            'reference': str(uuid.uuid4()), 'currency': 'USD', 'amount': 2.5,
+            'card_number': '4242424242424242', 'cvc': '737', 'first_name': 'Jane', 'last_name': 'Doe',
+            'email': 'jane.doe@example.com', 'address': '123 Main St', 'address2': 'Apt 4B',
+            'city': 'New York', 'state': 'NY', 'zip': '10001', 'country': 'US'
+        }
+    ]
 
-            assert 'reference' in refund_response
-            assert refund_response['reference'] == refund_request['reference']
+    # run_transaction asserts on each response, so this fails if any transaction or refund does
+    await run_transactions_for_list(sdk, transactions)
 
 
 # @pytest.mark.asyncio
 @pytest.mark.skip(reason="Skipping test_run_checkout_verification")
-async def test_run_checkout_verification():
+async def test_run_checkout_verification(init_sdk):
     # Test data for multiple transactions
     from faker import Faker
 
     # Initialize Faker
     fake = Faker()
 
-    us_processing_channel = os.getenv('CHECKOUT_PROCESSING_CHANNEL')
-    eu_processing_channel = os.getenv('CHECKOUT_PROCESSING_CHANNEL_EU')
-
     eu_transactions = [
         {
             'reference': '962080081111', 'currency': 'USD', 'amount': 1.992,
@@ -931,6 +628,6 @@ async def test_run_checkout_verification():
     ]
 
     # Initialize the SDK with environment variables
-    await run_transactions_for_list(us_processing_channel, us_transactions)
-    await run_transactions_for_list(eu_processing_channel, eu_transactions)
+    await run_transactions_for_list(init_sdk(), us_transactions)
+    await run_transactions_for_list(init_sdk(checkout={'processing_channel': CHECKOUT_PROCESSING_CHANNEL_EU}), eu_transactions)
 
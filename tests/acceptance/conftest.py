@@ -0,0 +1,118 @@
+import os
+import random
+import asyncio
+import functools
+import pytest
+import requests
+from typing import Any, Awaitable, Callable, Dict, Optional
+from dotenv import load_dotenv
+from orchestration_sdk import PaymentOrchestrationSDK
+from orchestration_sdk.exceptions import BasisTheoryError, TransactionError
+from orchestration_sdk.providers.adyen import AdyenClient
+from orchestration_sdk.providers.checkout import CheckoutClient
+
+# The shared assertion helpers aren't test modules, so opt them into pytest's assert rewriting
+# to get the same detailed failure messages
+pytest.register_assert_rewrite("_helpers")
+
+# Load environment variables from .env file; pytest imports this before the test modules,
+# so they can read os.environ at import without loading it again
+load_dotenv()
+
+# Credentials are read once; every SDK config built by the fixtures uses these
+BT_API_KEY = os.getenv('BASISTHEORY_API_KEY')
+ADYEN_API_KEY = os.getenv('ADYEN_API_KEY')
+ADYEN_MERCHANT_ACCOUNT = os.getenv('ADYEN_MERCHANT_ACCOUNT')
+CHECKOUT_PRIVATE_KEY = os.getenv('CHECKOUT_PRIVATE_KEY')
+CHECKOUT_PROCESSING_CHANNEL = os.getenv('CHECKOUT_PROCESSING_CHANNEL')
+
+# Rate limits from the test environments are retried rather than failing the test. A 429 means the
+# payment was refused before processing; 5xx responses are not retried, since the POST may have gone through
+RATE_LIMITED = 429
+TRANSACTION_TRIES = 3
+RETRY_BACKOFF = 0.25  # seconds before the first retry, doubled (with jitter) for each later one
+
+
+def sdk_config(
+    bt_api_key: Optional[str] = None,
+    adyen: Optional[Dict[str, Any]] = None,
+    checkout: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build the acceptance test SDK config, with optional overrides."""
+    return {
+        'is_test': True,
+        'bt_api_key': bt_api_key or BT_API_KEY,
+        'provider_config': {
+            'adyen': {
+                'api_key': ADYEN_API_KEY,
+                'merchant_account': ADYEN_MERCHANT_ACCOUNT,
+                **(adyen or {})
+            },
+            'checkout': {
+                'private_key': CHECKOUT_PRIVATE_KEY,
+                'processing_channel': CHECKOUT_PROCESSING_CHANNEL,
+                **(checkout or {})
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Run the whole acceptance suite on one event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def sdk():
+    """SDK configured for every provider, shared so its HTTP connections stay warm between tests."""
+    sdk = PaymentOrchestrationSDK.init(sdk_config())
+    yield sdk
+    sdk.close()
+
+
+@pytest.fixture
+def init_sdk(sdk):
+    """Re-initialize the SDK with overrides for one test, restoring the shared config afterwards."""
+    def init(**overrides: Any) -> PaymentOrchestrationSDK:
+        return PaymentOrchestrationSDK.init(sdk_config(**overrides))
+
+    yield init
+    PaymentOrchestrationSDK.init(sdk_config())
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an SDK error is a rate limit response, which is safe to retry."""
+    if isinstance(error, BasisTheoryError):
+        status = error.status
+    elif isinstance(error, TransactionError) and isinstance(error.__cause__, requests.HTTPError):
+        # The providers raise TransactionError from the HTTPError, which keeps the response
+        status = error.__cause__.response.status_code
+    else:
+        return False
+    return status == RATE_LIMITED
+
+
+def retry_rate_limited(transaction: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Wrap a provider's transaction() so rate limited calls are retried with exponential backoff."""
+    @functools.wraps(transaction)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for attempt in range(TRANSACTION_TRIES):
+            try:
+                return await transaction(*args, **kwargs)
+            except (TransactionError, BasisTheoryError) as e:
+                if attempt == TRANSACTION_TRIES - 1 or not _is_rate_limited(e):
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5))
+    return wrapper
+
+
+@pytest.fixture(autouse=True)
+def retry_rate_limits(monkeypatch):
+    """Retry provider transactions that hit a rate limit instead of failing the test."""
+    # Patched on the classes, since init_sdk replaces the SDK's provider clients
+    for client in (AdyenClient, CheckoutClient):
+        monkeypatch.setattr(client, 'transaction', retry_rate_limited(client.transaction))
+
@@ -1,4 +1,5 @@
 import os
+import json
 import uuid
 import pytest
 import requests
@@ -16,7 +17,7 @@ from orchestration_sdk.models import (
     Customer,
     Address
 )
-from orchestration_sdk.exceptions import TransactionError
+from orchestration_sdk.exceptions import TransactionError, BasisTheoryError
 
 @pytest.mark.asyncio
 async def test_errors():
@@ -99,7 +100,7 @@ async def test_errors():
 
         # Create a mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.status_code = 200
         mock_response.ok = True
 
@@ -123,7 +124,7 @@ async def test_errors():
         )
 
         # Mock the session.request method
-        with patch('requests.request', return_value=mock_response) as mock_request:
+        with patch('requests.Session.request', return_value=mock_response) as mock_request:
             # For error cases, expect TransactionError with correct error code
             with pytest.raises(TransactionError) as exc_info:
                 await sdk.adyen.transaction(transaction_request)
@@ -133,3 +134,159 @@ async def test_errors():
 
             # Verify the request was made
             mock_request.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_error_invalid_api_key():
+    # Initialize the SDK
+    sdk = PaymentOrchestrationSDK.init({
+        'is_test': True,
+        'bt_api_key': 'test_bt_api_key',
+        'provider_config': {
+            'adyen': {
+                'api_key': 'invalid',
+                'merchant_account': 'test_merchant',
+            }
+        }
+    })
+
+    # Adyen's 401, passed through the Basis Theory proxy
+    mock_response_data = {
+        "status": 401,
+        "errorCode": "000",
+        "message": "HTTP Status Response - Unauthorized",
+        "errorType": "security"
+    }
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(mock_response_data).encode()
+    mock_response.status_code = 401
+    mock_response.ok = False
+    mock_response.headers = {'Content-Type': 'application/json', 'BT-PROXY-DESTINATION-STATUS': '401'}
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+
+    transaction_request = TransactionRequest(
+        reference='test_reference',
+        type=RecurringType.ONE_TIME,
+        amount=Amount(value=1, currency='USD'),
+        source=Source(
+            type=SourceType.BASIS_THEORY_TOKEN,
+            id='test_token_id'
+        ),
+        customer=Customer(reference='test_customer_ref')
+    )
+
+    with patch('requests.Session.request', return_value=mock_response) as mock_request:
+        with pytest.raises(TransactionError) as exc_info:
+            await sdk.adyen.transaction(transaction_request)
+
+    error_response = exc_info.value.error_response
+    assert mock_request.call_count == 1
+    # The HTTPError is chained, so callers can still read the provider's status
+    assert exc_info.value.__cause__.response.status_code == 401
+    assert len(error_response.error_codes) == 1
+    assert error_response.error_codes[0].category == ErrorType.INVALID_API_KEY.category
+    assert error_response.error_codes[0].code == ErrorType.INVALID_API_KEY.code
+    assert error_response.provider_errors == ['HTTP Status Response - Unauthorized']
+    assert error_response.full_provider_response == mock_response_data
+
+@pytest.mark.asyncio
+async def test_error_invalid_bt_api_key():
+    # Initialize the SDK
+    sdk = PaymentOrchestrationSDK.init({
+        'is_test': True,
+        'bt_api_key': 'invalid',
+        'provider_config': {
+            'adyen': {
+                'api_key': 'test_adyen_api_key',
+                'merchant_account': 'test_merchant',
+            }
+        }
+    })
+
+    # The proxy rejects the request itself, so there is no BT-PROXY-DESTINATION-STATUS header
+    mock_response_data = {
+        "proxy_error": {
+            "title": "Unauthorized",
+            "status": 401,
+            "detail": "The BT-API-KEY header is required"
+        }
+    }
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(mock_response_data).encode()
+    mock_response.status_code = 401
+    mock_response.ok = False
+    mock_response.headers = {'Content-Type': 'application/json'}
+
+    transaction_request = TransactionRequest(
+        reference='test_reference',
+        type=RecurringType.ONE_TIME,
+        amount=Amount(value=1, currency='USD'),
+        source=Source(
+            type=SourceType.BASIS_THEORY_TOKEN,
+            id='test_token_id'
+        ),
+        customer=Customer(reference='test_customer_ref')
+    )
+
+    with patch('requests.Session.request', return_value=mock_response) as mock_request:
+        with pytest.raises(BasisTheoryError) as exc_info:
+            await sdk.adyen.transaction(transaction_request)
+
+    error = exc_info.value
+    assert mock_request.call_count == 1
+    assert error.status == 401
+    assert len(error.error_response.error_codes) == 1
+    assert error.error_response.error_codes[0].code == ErrorType.BT_UNAUTHENTICATED.code
+    assert error.error_response.provider_errors == []
+    assert error.error_response.full_provider_response == mock_response_data
+
+@pytest.mark.asyncio
+async def test_transaction_many_preserves_order():
+    # Initialize the SDK
+    sdk = PaymentOrchestrationSDK.init({
+        'is_test': True,
+        'bt_api_key': 'test_bt_api_key',
+        'provider_config': {
+            'adyen': {
+                'api_key': 'test_adyen_api_key',
+                'merchant_account': 'test_merchant',
+            }
+        }
+    })
+
+    result_codes = ["Authorised", "Refused", "Authorised"]
+
+    def mock_response_for(result_code):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "pspReference": f"psp_{result_code}",
+            "resultCode": result_code,
+            "refusalReason": "Refused" if result_code == "Refused" else None,
+            "refusalReasonCode": "2" if result_code == "Refused" else None,
+            "amount": {"value": 1, "currency": "USD"}
+        }).encode()
+        mock_response.status_code = 200
+        mock_response.ok = True
+        return mock_response
+
+    transaction_requests = [
+        TransactionRequest(
+            reference=str(uuid.uuid4()),
+            type=RecurringType.ONE_TIME,
+            amount=Amount(value=1, currency='USD'),
+            source=Source(
+                type=SourceType.PROCESSOR_TOKEN,
+                id='test_token_id'
+            )
+        )
+        for _ in result_codes
+    ]
+
+    with patch('requests.Session.request', side_effect=[mock_response_for(code) for code in result_codes]) as mock_request:
+        results = await sdk.adyen.transaction_many(transaction_requests, concurrency=1)
+
+    # One result per request, in request order, with failures returned rather than raised
+    assert mock_request.call_count == 3
+    assert results[0].status.code == TransactionStatusCode.AUTHORIZED
+    assert isinstance(results[1], TransactionError)
+    assert results[1].error_response.error_codes[0].code == ErrorType.REFUSED.code
+    assert results[2].status.code == TransactionStatusCode.AUTHORIZED
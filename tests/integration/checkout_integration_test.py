@@ -1,8 +1,9 @@
 import os
+import json
 import uuid
 import pytest
 import requests
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from orchestration_sdk import PaymentOrchestrationSDK
 from orchestration_sdk.models import (
@@ -91,7 +92,7 @@ async def test_errors():
 
         # Create a mock response that raises HTTPError
         mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_response.status_code = 422
         mock_response.ok = False
 
@@ -118,7 +119,7 @@ async def test_errors():
         )
 
         # Mock the session.request method to raise HTTPError
-        with patch('requests.request', side_effect=mock_error) as mock_request:
+        with patch('requests.Session.request', side_effect=mock_error) as mock_request:
             # Make the transaction request and expect a TransactionError
             with pytest.raises(TransactionError) as exc_info:
                 await sdk.checkout.transaction(transaction_request)
@@ -129,6 +130,9 @@ async def test_errors():
             # Verify the request was made with correct parameters
             mock_request.assert_called_once()
 
+            # The HTTPError is chained, so callers can still read the provider's status
+            assert exc_info.value.__cause__ is mock_error
+
             # Validate error response structure
             assert isinstance(error_response.error_codes, list)
             assert len(error_response.error_codes) == 1
@@ -146,3 +150,114 @@ async def test_errors():
             assert isinstance(error_response.full_provider_response, dict)
             assert error_response.full_provider_response['error_type'] == test_case["error_type"]
             assert error_response.full_provider_response['error_codes'] == test_case["error_codes"]
+
+
+@pytest.mark.asyncio
+async def test_created_at_from_processed_on():
+    # Initialize the SDK
+    sdk = PaymentOrchestrationSDK.init({
+        'is_test': True,
+        'bt_api_key': 'test_bt_api_key',
+        'provider_config': {
+            'checkout': {
+                'private_key': 'test_private_key',
+                'processing_channel': 'test_channel',
+            }
+        }
+    })
+
+    transaction_request = TransactionRequest(
+        reference='test_reference',
+        type=RecurringType.ONE_TIME,
+        amount=Amount(value=1, currency='USD'),
+        source=Source(
+            type=SourceType.PROCESSOR_TOKEN,
+            id='test_token_id'
+        )
+    )
+
+    # Checkout.com sends the fractional seconds with up to 7 digits, or not at all
+    for processed_on in ["2024-05-01T12:34:56.1234567Z", "2024-05-01T12:34:56Z"]:
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "id": "pay_test",
+            "reference": "test_reference",
+            "amount": 1,
+            "currency": "USD",
+            "status": "Authorized",
+            "processed_on": processed_on
+        }).encode()
+        mock_response.status_code = 201
+        mock_response.ok = True
+
+        with patch('requests.Session.request', return_value=mock_response):
+            response = await sdk.checkout.transaction(transaction_request)
+
+        assert response.created_at == datetime(2024, 5, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_transaction_many_returns_failure_in_position():
+    # Initialize the SDK
+    sdk = PaymentOrchestrationSDK.init({
+        'is_test': True,
+        'bt_api_key': 'test_bt_api_key',
+        'provider_config': {
+            'checkout': {
+                'private_key': 'test_private_key',
+                'processing_channel': 'test_channel',
+            }
+        }
+    })
+
+    transaction_requests = [
+        TransactionRequest(
+            reference=str(uuid.uuid4()),
+            type=RecurringType.ONE_TIME,
+            amount=Amount(value=1, currency='USD'),
+            source=Source(
+                type=SourceType.PROCESSOR_TOKEN,
+                id='test_token_id'
+            )
+        )
+        for _ in range(3)
+    ]
+    failing_reference = transaction_requests[1].reference
+
+    # Requests run concurrently, so answer each by its reference rather than by call order
+    def mock_response_for(**kwargs):
+        reference = json.loads(kwargs['data'])['reference']
+        mock_response = MagicMock()
+        if reference == failing_reference:
+            mock_response.content = json.dumps({
+                "request_id": "8837544667111111",
+                "error_type": "processing_error",
+                "error_codes": ["card_expired"]
+            }).encode()
+            mock_response.status_code = 422
+            mock_response.ok = False
+            mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=mock_response)
+        else:
+            mock_response.content = json.dumps({
+                "id": f"pay_{reference}",
+                "reference": reference,
+                "amount": 1,
+                "currency": "USD",
+                "status": "Authorized",
+                "processed_on": "2024-05-01T12:34:56Z"
+            }).encode()
+            mock_response.status_code = 201
+            mock_response.ok = True
+        return mock_response
+
+    with patch('requests.Session.request', side_effect=mock_response_for) as mock_request:
+        results = await sdk.checkout.transaction_many(transaction_requests)
+
+    # The failure in the middle comes back in its own position without cancelling the others
+    assert mock_request.call_count == 3
+    assert results[0].reference == transaction_requests[0].reference
+    assert results[0].status.code == TransactionStatusCode.AUTHORIZED
+    assert isinstance(results[1], TransactionError)
+    assert results[1].error_response.error_codes[0].code == ErrorType.EXPIRED_CARD.code
+    assert results[2].reference == transaction_requests[2].reference
+    assert results[2].status.code == TransactionStatusCode.AUTHORIZED
@@ -0,0 +1,52 @@
+import json
+import math
+import pytest
+from orchestration_sdk.utils import json_utils
+from orchestration_sdk.utils.json_utils import dumps, loads
+
+
+def test_dumps_encodes_compact_utf8_json():
+    body = dumps({"reference": "ref_é", "amount": {"value": 100, "currency": "USD"}})
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"reference": "ref_é", "amount": {"value": 100, "currency": "USD"}}
+    assert b", " not in body and b": " not in body
+
+
+def test_dumps_matches_stdlib_for_non_str_keys_and_wide_integers():
+    data = {1: "one", "big": 2 ** 70}
+
+    assert json.loads(dumps(data)) == json.loads(json.dumps(data))
+
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf')])
+def test_dumps_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        dumps({"amount": value})
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson, when it is installed, and with the stdlib fallback."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+        monkeypatch.setattr(json_utils, 'HAS_ORJSON', True)
+    else:
+        monkeypatch.setattr(json_utils, 'HAS_ORJSON', False)
+    return request.param
+
+
+def test_loads_parses_provider_responses(json_backend):
+    body = '{"pspReference":"psp_é","resultCode":"Authorised","amount":{"value":100,"currency":"USD"},"additionalData":null}'
+
+    assert loads(body.encode()) == loads(body) == json.loads(body)
+
+
+@pytest.mark.parametrize('body', [b'{"amount":NaN}', b'{"amount":Infinity}'])
+def test_loads_accepts_non_finite_literals(json_backend, body):
+    assert math.isnan(loads(body)['amount']) or math.isinf(loads(body)['amount'])
+
+
+def test_loads_rejects_invalid_json(json_backend):
+    with pytest.raises(ValueError):
+        loads(b'<html>Bad Gateway</html>')